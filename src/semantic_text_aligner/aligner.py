@@ -5,33 +5,288 @@ DTW-based sequence alignment using litellm embeddings.
 
 from __future__ import annotations
 
-from math import sqrt
+import asyncio
+import base64
+import hashlib
+import sqlite3
+import warnings
+from collections import OrderedDict
+from contextlib import closing, nullcontext
+from itertools import chain
+from pathlib import Path
 from typing import Iterable, Optional, Sequence, Tuple, Union
 
-from litellm import embedding
+import numpy as np
 from loguru import logger
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional speedup
+    njit = None
+
 AlignmentInput = Union[
     Tuple[list[Optional[str]], list[Optional[str]]],
     list[Tuple[Optional[str], Optional[str]]],
 ]
 
+# Backpointer codes stored in the int8 ``back`` matrix.
+_MOVE_DIAG = 0
+_MOVE_UP = 1
+_MOVE_LEFT = 2
+
+# Above this many DP cells (16 MB of int8 backpointers), split the problem
+# Hirschberg-style instead of materializing the full backpointer matrix.
+_MAX_BACK_CELLS = 16_000_000
+
+# Tile edge for the cache-blocked DTW fill (a 65x65 float64 tile is ~33 KB).
+_DTW_BLOCK = 64
+
+# Inputs per litellm embedding request, and how many requests may be in flight.
+EMBED_BATCH_SIZE = 96
+EMBED_CONCURRENCY = 8
+# Providers that honour encoding_format="base64" and return packed float32
+# payloads, which decode straight into the output matrix without a list of floats.
+_BASE64_PROVIDERS = frozenset({"openai", "azure"})
+
+# Persistent embedding cache; pass cache_path=None to disable it.
+DEFAULT_CACHE_PATH = Path("~/.cache/sta/embeds.sqlite")
+# Stay well below SQLite's bound-parameter limit in IN (...) lookups.
+_CACHE_QUERY_BATCH = 500
+
+
+# In-process LRU of unit-normalized vectors, shared by every call in this
+# interpreter; a text's norm is therefore computed once per process.
+_MEMORY_CACHE_SIZE = 100_000
+_memory_cache: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+
+
+def _memory_cache_get(model: str, text: str) -> Optional[np.ndarray]:
+    """Return the in-process cached vector for (model, text), marking it recent."""
+    vec = _memory_cache.get((model, text))
+    if vec is not None:
+        _memory_cache.move_to_end((model, text))
+    return vec
+
+
+def _memory_cache_put(model: str, text: str, vec: np.ndarray) -> None:
+    """Remember a unit vector in-process, evicting the least recently used."""
+    _memory_cache[(model, text)] = vec
+    _memory_cache.move_to_end((model, text))
+    while len(_memory_cache) > _MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
+def _cache_key(model: str, text: str) -> bytes:
+    """Cache key for one embedding; including the model avoids collisions."""
+    return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).digest()
+
+
+def _open_cache(cache_path: Path) -> Optional[sqlite3.Connection]:
+    """Open (creating if needed) the SQLite embedding cache, or None on failure."""
+    path = cache_path.expanduser()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS emb (key BLOB PRIMARY KEY, vec BLOB NOT NULL)")
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning(f"Embedding cache at {path} unavailable: {exc}")
+        return None
+    return conn
+
+
+def _cache_load(conn: sqlite3.Connection, keys: list[bytes]) -> dict[bytes, bytes]:
+    """Fetch cached float32 vector bytes for any of the given keys."""
+    found: dict[bytes, bytes] = {}
+    for start in range(0, len(keys), _CACHE_QUERY_BATCH):
+        batch = keys[start : start + _CACHE_QUERY_BATCH]
+        placeholders = ",".join("?" * len(batch))
+        rows = conn.execute(
+            f"SELECT key, vec FROM emb WHERE key IN ({placeholders})", batch
+        )
+        found.update(rows)
+    return found
+
+
+def _cache_store(conn: sqlite3.Connection, items: Iterable[tuple[bytes, bytes]]) -> None:
+    """Persist (key, float32 vector bytes) pairs in a single transaction."""
+    with conn:
+        conn.executemany("INSERT OR REPLACE INTO emb (key, vec) VALUES (?, ?)", items)
+
+
+def _response_vectors(response: object, expected: int) -> list:
+    """Pull the per-input embedding vectors out of a litellm response."""
+    data = getattr(response, "data", None)
+    if data is None and isinstance(response, dict):
+        data = response.get("data")
+    if data is None:
+        raise ValueError("litellm embedding response missing 'data' field")
+    if len(data) != expected:
+        raise ValueError(f"litellm returned {len(data)} embeddings for {expected} inputs")
+    # litellm responses may expose attributes or dict-style access
+    return [
+        record.embedding if hasattr(record, "embedding") else record.get("embedding")
+        for record in data
+    ]
+
+
+def _embedding_kwargs(model: str) -> dict[str, str]:
+    """Extra litellm arguments: ask for base64 payloads where the provider supports them."""
+    import litellm
+
+    try:
+        _, provider, _, _ = litellm.get_llm_provider(model)
+    except litellm.BadRequestError:
+        return {}
+    return {"encoding_format": "base64"} if provider in _BASE64_PROVIDERS else {}
+
+
+def _decode_vector(vec: object) -> object:
+    """Return a base64 float32 payload as an ndarray view; other vectors pass through."""
+    if isinstance(vec, str):
+        return np.frombuffer(base64.b64decode(vec), dtype=np.float32)
+    return vec
 
-def _cosine_distance(vec_a: Sequence[float], vec_b: Sequence[float]) -> float:
-    """Compute cosine distance (1 - cosine similarity) between two vectors."""
-    dot_product = sum(x * y for x, y in zip(vec_a, vec_b))
-    norm_a = sqrt(sum(x * x for x in vec_a))
-    norm_b = sqrt(sum(y * y for y in vec_b))
-    if norm_a == 0.0 or norm_b == 0.0:
-        return 1.0
-    similarity = max(min(dot_product / (norm_a * norm_b), 1.0), -1.0)
-    return 1.0 - similarity
+
+async def _request_batches_async(
+    batches: list[list[str]], model: str, concurrency: int, **kwargs: str
+) -> list[object]:
+    """Send every batch through litellm.aembedding with bounded concurrency."""
+    import litellm
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _request(batch: list[str]) -> object:
+        async with semaphore:
+            return await litellm.aembedding(model=model, input=batch, **kwargs)
+
+    return await asyncio.gather(*(_request(batch) for batch in batches))
+
+
+def _request_embeddings(
+    texts: list[str],
+    model: str,
+    batch_size: int = EMBED_BATCH_SIZE,
+    concurrency: int = EMBED_CONCURRENCY,
+) -> np.ndarray:
+    """Fetch raw embeddings from litellm as a contiguous ``(len(texts), d)`` float32 matrix.
+
+    Inputs are split into batches of at most ``batch_size`` so provider batch
+    limits are respected; multiple batches are sent concurrently. Inside an
+    already-running event loop the batches are sent one after another. Providers
+    that support it return base64 float32 payloads, decoded without float lists.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    # litellm is imported only when something has to be embedded: its import is
+    # slow and may reach for the network, and DTW-only callers such as the
+    # chunk pool workers in core never need it.
+    import litellm
+
+    batches = [texts[start : start + batch_size] for start in range(0, len(texts), batch_size)]
+    logger.info(
+        f"Requesting embeddings for {len(texts)} unique items via {model} "
+        f"in {len(batches)} batch(es)"
+    )
+
+    try:
+        asyncio.get_running_loop()
+        in_event_loop = True
+    except RuntimeError:
+        in_event_loop = False
+    kwargs = _embedding_kwargs(model)
+    with warnings.catch_warnings():
+        if kwargs:
+            # litellm's response model types embeddings as list[float], so
+            # pydantic warns about every base64 string while building it.
+            warnings.filterwarnings(
+                "ignore", message="Pydantic serializer warnings", category=UserWarning
+            )
+        if len(batches) > 1 and concurrency > 1 and not in_event_loop:
+            responses = asyncio.run(
+                _request_batches_async(batches, model, concurrency, **kwargs)
+            )
+        else:
+            responses = [
+                litellm.embedding(model=model, input=batch, **kwargs) for batch in batches
+            ]
+
+    matrix: Optional[np.ndarray] = None
+    row = 0
+    for batch, response in zip(batches, responses):
+        for vec in _response_vectors(response, len(batch)):
+            vec = _decode_vector(vec)
+            if matrix is None:
+                matrix = np.empty((len(texts), len(vec)), dtype=np.float32)
+            matrix[row] = vec
+            row += 1
+    assert matrix is not None
+    return matrix
+
+
+def _fetch_embeddings(
+    texts: list[str],
+    model: str,
+    cache_path: Optional[Path],
+    batch_size: int = EMBED_BATCH_SIZE,
+    concurrency: int = EMBED_CONCURRENCY,
+) -> list[np.ndarray]:
+    """Return raw float32 vectors for texts from the disk cache or litellm."""
+    conn = _open_cache(cache_path) if cache_path is not None else None
+    with closing(conn) if conn is not None else nullcontext():
+        keys = [_cache_key(model, text) for text in texts]
+        cached: dict[bytes, bytes] = {}
+        if conn is not None:
+            try:
+                cached = _cache_load(conn, keys)
+            except sqlite3.Error as exc:
+                # e.g. another process holds the lock; carry on uncached.
+                logger.warning(f"Embedding cache lookup failed, continuing without it: {exc}")
+                conn = None
+        if cached:
+            logger.debug(f"Embedding cache hits: {len(cached)}/{len(texts)}")
+        vectors: list[Optional[np.ndarray]] = [
+            np.frombuffer(cached[key], dtype=np.float32) if key in cached else None
+            for key in keys
+        ]
+
+        missing = [row for row, vec in enumerate(vectors) if vec is None]
+        if missing:
+            fresh = _request_embeddings(
+                [texts[row] for row in missing],
+                model,
+                batch_size=batch_size,
+                concurrency=concurrency,
+            )
+            for row, vec in zip(missing, fresh):
+                vectors[row] = vec
+            if conn is not None:
+                try:
+                    _cache_store(
+                        conn,
+                        ((keys[row], vec.tobytes()) for row, vec in zip(missing, fresh)),
+                    )
+                except sqlite3.Error as exc:
+                    logger.warning(f"Embedding cache write failed, results not cached: {exc}")
+
+    return vectors  # type: ignore[return-value]
 
 
 def _embed_texts(
-    texts: Iterable[Optional[str]], model: str
-) -> dict[str, Sequence[float]]:
-    """Embed unique non-empty strings with litellm and return a lookup map."""
+    texts: Iterable[Optional[str]],
+    model: str,
+    cache_path: Optional[Path] = DEFAULT_CACHE_PATH,
+    batch_size: int = EMBED_BATCH_SIZE,
+    concurrency: int = EMBED_CONCURRENCY,
+) -> tuple[np.ndarray, dict[str, int]]:
+    """Embed unique non-empty strings with litellm, reusing cached vectors.
+
+    Returns a contiguous ``(U, d)`` float32 matrix of L2-normalized embeddings
+    and a map from each text to its row in that matrix. Vectors are looked up
+    in an in-process LRU first, then on disk under
+    ``sha256(model + "\\0" + text)``, so only misses hit litellm.
+    """
     seen: dict[str, int] = {}
     ordered: list[str] = []
     for item in texts:
@@ -42,22 +297,31 @@ def _embed_texts(
             ordered.append(item)
 
     if not ordered:
-        return {}
+        return np.empty((0, 0), dtype=np.float32), {}
 
-    logger.info(f"Requesting embeddings for {len(ordered)} unique items via {model}")
-    response = embedding(model=model, input=ordered)
-    data = getattr(response, "data", None)
-    if data is None and isinstance(response, dict):  # type: ignore[unreachable]
-        data = response.get("data")
-    if data is None:
-        raise ValueError("litellm embedding response missing 'data' field")
-    vectors: list[Sequence[float]] = []
-    for record in data:
-        # litellm responses may expose attributes or dict-style access
-        vec = record.embedding if hasattr(record, "embedding") else record.get("embedding")
-        vectors.append(vec)
+    unit = [_memory_cache_get(model, text) for text in ordered]
+    pending = [row for row, vec in enumerate(unit) if vec is None]
+    if pending:
+        fetched = np.stack(
+            _fetch_embeddings(
+                [ordered[row] for row in pending],
+                model,
+                cache_path,
+                batch_size=batch_size,
+                concurrency=concurrency,
+            )
+        )
+        # Normalize only the new vectors, once; cached ones are already unit.
+        norms = np.linalg.norm(fetched, axis=1, keepdims=True)
+        # Zero vectors stay zero so they end up at the maximum distance of 1.0.
+        norms[norms == 0.0] = 1.0
+        fetched /= norms
+        for row, vec in zip(pending, fetched):
+            unit[row] = vec
+            # Copy so a cached row does not keep the whole batch matrix alive.
+            _memory_cache_put(model, ordered[row], vec.copy())
 
-    return {text: vectors[idx] for idx, text in enumerate(ordered)}
+    return np.stack(unit), seen  # type: ignore[arg-type]
 
 
 def _normalize_input(
@@ -79,82 +343,370 @@ def _normalize_input(
     raise ValueError("Input must be either (list, list) or list of tuples")
 
 
-def _pair_cost(
-    left_item: Optional[str],
-    right_item: Optional[str],
-    embeddings: dict[str, Sequence[float]],
+# Row codes for tokens that have no embedding row.
+_ROW_NONE = -2
+_ROW_MISSING = -1
+
+
+def _cost_matrix(
+    left: Sequence[Optional[str]],
+    right: Sequence[Optional[str]],
+    vectors: np.ndarray,
+    index: dict[str, int],
     gap_penalty: float,
-) -> float:
-    """Cost of aligning two tokens, falling back to gap penalty when missing."""
-    if left_item is None and right_item is None:
-        return 0.0
-    if left_item is None or right_item is None:
-        return gap_penalty
-    vec_left = embeddings.get(left_item)
-    vec_right = embeddings.get(right_item)
-    if vec_left is None or vec_right is None:
-        return gap_penalty
-    return _cosine_distance(vec_left, vec_right)
+) -> np.ndarray:
+    """Build the ``(m, n)`` pair-cost matrix from one GEMM over unique rows.
 
+    Aligning two tokens costs their cosine distance; a token against ``None``
+    (or a token without an embedding) costs ``gap_penalty``, and ``None``
+    against ``None`` is free. Repeated tokens share a single row/column of the
+    product, which is then expanded back to the full matrix by indexing.
+    """
 
-def align_sequences(
-    input_data: AlignmentInput,
-    gap_penalty: float = 0.1,
-    model: str = "ollama/nomic-embed-text",
-) -> list[tuple[Optional[str], Optional[str]]]:
-    """Run DTW alignment and return a list of (left, right) tuples."""
-    left, right = _normalize_input(input_data)
-    embeddings = _embed_texts([*left, *right], model=model)
+    def _rows(items: Sequence[Optional[str]]) -> np.ndarray:
+        return np.array(
+            [_ROW_NONE if x is None else index.get(x, _ROW_MISSING) for x in items],
+            dtype=np.intp,
+        )
 
-    m, n = len(left), len(right)
-    dp = [[0.0] * (n + 1) for _ in range(m + 1)]
-    back: list[list[Optional[str]]] = [[None] * (n + 1) for _ in range(m + 1)]
-    move: Optional[str] = None
+    unique_left, inverse_left = np.unique(_rows(left), return_inverse=True)
+    unique_right, inverse_right = np.unique(_rows(right), return_inverse=True)
 
-    for i in range(1, m + 1):
-        dp[i][0] = i * gap_penalty
-        back[i][0] = "U"
-    for j in range(1, n + 1):
-        dp[0][j] = j * gap_penalty
-        back[0][j] = "L"
+    if vectors.shape[0]:
+        # float32 @ float32 dispatches to BLAS SGEMM; clip and negate in place so
+        # the matrix stays float32 (half the traffic of float64) end to end.
+        unique_cost = np.ascontiguousarray(vectors[np.maximum(unique_left, 0)]) @ (
+            np.ascontiguousarray(vectors[np.maximum(unique_right, 0)]).T
+        )
+        np.clip(unique_cost, -1.0, 1.0, out=unique_cost)
+        np.subtract(1.0, unique_cost, out=unique_cost)
+    else:
+        unique_cost = np.zeros((len(unique_left), len(unique_right)), dtype=np.float32)
 
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            cost_diag = dp[i - 1][j - 1] + _pair_cost(
-                left[i - 1], right[j - 1], embeddings, gap_penalty
+    unique_cost[unique_left < 0, :] = gap_penalty
+    unique_cost[:, unique_right < 0] = gap_penalty
+    unique_cost[np.ix_(unique_left == _ROW_NONE, unique_right == _ROW_NONE)] = 0.0
+    return unique_cost[np.ix_(inverse_left.ravel(), inverse_right.ravel())]
+
+
+def _band_bounds(
+    m: int, n: int, band_radius: Optional[int]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Inclusive column range ``[lo[i], hi[i]]`` of DP row ``i`` that may be filled.
+
+    Without a band every row spans ``0..n``. With a Sakoe-Chiba band, row ``i``
+    keeps columns within ``band_radius`` of the diagonal ``i * n / m``; the
+    radius is widened to at least ``ceil(n / m)`` so the band stays connected.
+    """
+    if band_radius is not None and band_radius < 0:
+        raise ValueError("band_radius must be non-negative")
+    if band_radius is None or m == 0 or n == 0:
+        return np.zeros(m + 1, dtype=np.int64), np.full(m + 1, n, dtype=np.int64)
+    radius = max(band_radius, -(-n // m))
+    center = (np.arange(m + 1, dtype=np.int64) * n) // m
+    return np.maximum(center - radius, 0), np.minimum(center + radius, n)
+
+
+def _dtw_fill_diagonals(
+    cost: np.ndarray, gap_penalty: float, lo: np.ndarray, hi: np.ndarray
+) -> tuple[float, np.ndarray]:
+    """Fill the DTW table one anti-diagonal at a time (pure NumPy fallback).
+
+    Every cell on anti-diagonal ``k = i + j`` depends only on diagonals
+    ``k - 1`` and ``k - 2``, so each diagonal is a handful of vectorized ops
+    and only three rolling diagonals (indexed by ``i``) are kept instead of
+    the whole cost table. Cells outside ``[lo[i], hi[i]]`` are infinite.
+    Ties prefer diagonal, then up, then left moves.
+    """
+    m, n = cost.shape
+    back = np.empty((m + 1, n + 1), dtype=np.int8)
+    back[:, 0] = _MOVE_UP
+    back[0, :] = _MOVE_LEFT
+
+    def _top(j: int) -> float:
+        return j * gap_penalty if j <= hi[0] else np.inf
+
+    def _side(i: int) -> float:
+        return i * gap_penalty if lo[i] == 0 else np.inf
+
+    # diag_k[i] holds dp[i, k - i]; boundary cells are i * gap or j * gap.
+    diag_prev2 = np.zeros(m + 1, dtype=np.float64)
+    diag_prev1 = np.zeros(m + 1, dtype=np.float64)
+    diag_curr = np.zeros(m + 1, dtype=np.float64)
+    if n:
+        diag_prev1[0] = _top(1)
+    if m:
+        diag_prev1[1] = _side(1)
+
+    for k in range(2, m + n + 1):
+        i = np.arange(max(1, k - n), min(m, k - 1) + 1)
+        j = k - i
+        candidates = np.stack(
+            (
+                diag_prev2[i - 1] + cost[i - 1, j - 1],
+                diag_prev1[i - 1] + gap_penalty,  # gap in right
+                diag_prev1[i] + gap_penalty,  # gap in left
             )
-            cost_up = dp[i - 1][j] + gap_penalty  # gap in right
-            cost_left = dp[i][j - 1] + gap_penalty  # gap in left
+        )
+        moves = np.argmin(candidates, axis=0)
+        values = candidates[moves, np.arange(len(i))]
+        values[(j < lo[i]) | (j > hi[i])] = np.inf
+        diag_curr[i] = values
+        back[i, j] = moves
+        if k <= n:
+            diag_curr[0] = _top(k)
+        if k <= m:
+            diag_curr[k] = _side(k)
+        diag_prev2, diag_prev1, diag_curr = diag_prev1, diag_curr, diag_prev2
 
-            best_cost = cost_diag
-            move = "D"
-            if cost_up < best_cost:
-                best_cost = cost_up
-                move = "U"
-            if cost_left < best_cost:
-                best_cost = cost_left
-                move = "L"
+    if m + n == 0:
+        return 0.0, back
+    return float(diag_prev1[m]), back
 
-            dp[i][j] = best_cost
-            back[i][j] = move
 
-    aligned: list[tuple[Optional[str], Optional[str]]] = []
-    i, j = m, n
+def _dtw_fill_loops(
+    cost: np.ndarray, gap_penalty: float, lo: np.ndarray, hi: np.ndarray
+) -> tuple[float, np.ndarray]:
+    """Scalar, cache-blocked DTW fill; compiled with numba when available.
+
+    Rows are processed in strips of ``_DTW_BLOCK`` and each strip in
+    ``_DTW_BLOCK``-wide tiles, so the working set of a tile stays in cache.
+    Only the current strip of the accumulated-cost (DP) table, plus the last
+    DP row of the previous strip in ``strip[0]``, is kept alive; the pair-cost
+    matrix from ``_cost_matrix`` is only read. Row ``i`` only visits
+    columns ``lo[i]..hi[i]``; the few cells just outside that its neighbours
+    read are set to infinity. Produces the same total cost and backpointers
+    as ``_dtw_fill_diagonals``.
+    """
+    m, n = cost.shape
+    block = _DTW_BLOCK
+    back = np.empty((m + 1, n + 1), dtype=np.int8)
+    strip = np.empty((block + 1, n + 1), dtype=np.float64)
+    for j in range(n + 1):
+        strip[0, j] = j * gap_penalty if j <= hi[0] else np.inf
+        back[0, j] = _MOVE_LEFT
+
+    for ii in range(1, m + 1, block):
+        rows = min(block, m + 1 - ii)
+        for r in range(1, rows + 1):
+            i = ii + r - 1
+            strip[r, 0] = i * gap_penalty if lo[i] == 0 else np.inf
+            back[i, 0] = _MOVE_UP
+            if lo[i] > 1:
+                strip[r, lo[i] - 1] = np.inf
+            # The next row reads this one up to its own (wider) hi.
+            for j in range(hi[i] + 1, hi[min(i + 1, m)] + 1):
+                strip[r, j] = np.inf
+        for jj in range(1, n + 1, block):
+            j_end = min(jj + block, n + 1)
+            for r in range(1, rows + 1):
+                i = ii + r - 1
+                for j in range(max(jj, lo[i]), min(j_end, hi[i] + 1)):
+                    cost_diag = strip[r - 1, j - 1] + cost[i - 1, j - 1]
+                    cost_up = strip[r - 1, j] + gap_penalty  # gap in right
+                    cost_left = strip[r, j - 1] + gap_penalty  # gap in left
+
+                    # Branchless min-of-three: min() lowers to minsd and the
+                    # move is pure arithmetic on the comparisons, preferring
+                    # diag (0), then up (1), then left (2) on ties.
+                    best_cost = min(min(cost_diag, cost_up), cost_left)
+                    move = (best_cost != cost_diag) * (1 + (best_cost != cost_up))
+
+                    strip[r, j] = best_cost
+                    back[i, j] = move
+        strip[0, :] = strip[rows, :]
+
+    return strip[0, n], back
+
+
+_dtw_fill_numba = (
+    njit(cache=True, boundscheck=False)(_dtw_fill_loops) if njit is not None else None
+)
+
+
+def _dtw_fill(
+    cost: np.ndarray, gap_penalty: float, lo: np.ndarray, hi: np.ndarray
+) -> tuple[float, np.ndarray]:
+    """Return the total alignment cost and the int8 backpointer matrix."""
+    if _dtw_fill_numba is not None:
+        # float32 costs are accumulated into the float64 strip inside the kernel.
+        return _dtw_fill_numba(
+            np.ascontiguousarray(cost),
+            float(gap_penalty),
+            np.ascontiguousarray(lo),
+            np.ascontiguousarray(hi),
+        )
+    return _dtw_fill_diagonals(cost, gap_penalty, lo, hi)
+
+
+def _traceback_loops(back: np.ndarray) -> np.ndarray:
+    """Walk int8 backpointers from the bottom-right corner; compiled when possible.
+
+    Moves are written from the end of a preallocated int8 buffer, so the
+    result comes out in forward order without a reversal pass.
+    """
+    i, j = back.shape[0] - 1, back.shape[1] - 1
+    moves = np.empty(i + j, dtype=np.int8)
+    k = i + j
     while i > 0 or j > 0:
-        move = back[i][j]
-        if move == "D":
-            aligned.append((left[i - 1], right[j - 1]))
+        move = back[i, j]
+        k -= 1
+        moves[k] = move
+        if move == _MOVE_DIAG:
             i -= 1
             j -= 1
-        elif move == "U":
-            aligned.append((left[i - 1], None))
+        elif move == _MOVE_UP:
             i -= 1
-        elif move == "L":
-            aligned.append((None, right[j - 1]))
+        else:
             j -= 1
+    return moves[k:]
+
+
+_traceback_numba = (
+    njit(cache=True, boundscheck=False)(_traceback_loops) if njit is not None else None
+)
+
+
+def _traceback_moves(back: np.ndarray) -> list[int]:
+    """Return the optimal move sequence (forward order) encoded in ``back``."""
+    if _traceback_numba is not None:
+        return _traceback_numba(back).tolist()
+    # A memoryview yields plain ints per cell, much cheaper than NumPy scalars.
+    return _traceback_loops(memoryview(back)).tolist()  # type: ignore[arg-type]
+
+
+def _last_row_costs(
+    cost: np.ndarray, gap_penalty: float, lo: np.ndarray, hi: np.ndarray
+) -> np.ndarray:
+    """Return the final DP row ``dp[m, :]`` using ``O(n)`` memory.
+
+    Each row is two vectorized candidates (diag, up) followed by a running
+    minimum that accounts for any number of left moves. Cells outside
+    ``[lo[i], hi[i]]`` are infinite.
+    """
+    m, n = cost.shape
+    offsets = np.arange(n + 1) * gap_penalty
+    row = offsets.copy()
+    row[hi[0] + 1 :] = np.inf
+    candidates = np.empty(n + 1, dtype=np.float64)
+    for i in range(1, m + 1):
+        candidates[0] = i * gap_penalty
+        np.minimum(row[:-1] + cost[i - 1], row[1:] + gap_penalty, out=candidates[1:])
+        candidates[: lo[i]] = np.inf
+        row = np.minimum.accumulate(candidates - offsets) + offsets
+        row[hi[i] + 1 :] = np.inf
+    return row
+
+
+def _alignment_moves(
+    cost: np.ndarray, gap_penalty: float, lo: np.ndarray, hi: np.ndarray
+) -> tuple[float, list[int]]:
+    """Return the total cost and the optimal move sequence for a cost matrix.
+
+    Small problems keep a full int8 backpointer matrix. Above
+    ``_MAX_BACK_CELLS`` cells the rows are split in half (Hirschberg): the
+    forward costs to the middle row and the backward costs from the end pick
+    the column the optimal path crosses at, and each half is solved
+    recursively, so memory stays ``O(n)`` beyond the base case. On such large
+    inputs equal-cost paths may break ties differently from the full matrix.
+    """
+    m, n = cost.shape
+    if m < 2 or (m + 1) * (n + 1) <= _MAX_BACK_CELLS:
+        total_cost, back = _dtw_fill(cost, gap_penalty, lo, hi)
+        return total_cost, _traceback_moves(back)
+
+    mid = m // 2
+    forward = _last_row_costs(cost[:mid], gap_penalty, lo[: mid + 1], hi[: mid + 1])
+    # Row i of the reversed problem is row m - i mirrored around column n.
+    backward = _last_row_costs(
+        cost[mid:][::-1, ::-1], gap_penalty, n - hi[mid:][::-1], n - lo[mid:][::-1]
+    )[::-1]
+    through = forward + backward
+    split = int(np.argmin(through))
+    _, top = _alignment_moves(
+        cost[:mid, :split],
+        gap_penalty,
+        lo[: mid + 1],
+        np.minimum(hi[: mid + 1], split),
+    )
+    _, bottom = _alignment_moves(
+        cost[mid:, split:],
+        gap_penalty,
+        np.maximum(lo[mid:] - split, 0),
+        hi[mid:] - split,
+    )
+    return float(through[split]), top + bottom
+
+
+def align_sequences(
+    input_data: AlignmentInput,
+    gap_penalty: float = 0.1,
+    model: str = "ollama/nomic-embed-text",
+    cache_path: Optional[Path] = DEFAULT_CACHE_PATH,
+    embeddings: Optional[tuple[np.ndarray, dict[str, int]]] = None,
+    band_radius: Optional[int] = None,
+) -> list[tuple[Optional[str], Optional[str]]]:
+    """Run DTW alignment and return a list of (left, right) tuples.
+
+    Embeddings are cached on disk at ``cache_path``; pass None to disable.
+    Callers that already hold ``_embed_texts`` output for every token can pass
+    it as ``embeddings`` to skip the lookup entirely.
+
+    ``band_radius`` restricts the DP to a Sakoe-Chiba band around the
+    diagonal, cutting work from ``O(mn)`` to ``O((m + n) * band_radius)``.
+    Suited to near-parallel inputs; if the true alignment leaves the band its
+    cost grows, and the caller can widen the band and retry.
+    """
+    left, right = _normalize_input(input_data)
+    return _align_sequences_normalized(
+        left,
+        right,
+        gap_penalty=gap_penalty,
+        model=model,
+        cache_path=cache_path,
+        embeddings=embeddings,
+        band_radius=band_radius,
+    )
+
+
+def _align_sequences_normalized(
+    left: Sequence[Optional[str]],
+    right: Sequence[Optional[str]],
+    gap_penalty: float = 0.1,
+    model: str = "ollama/nomic-embed-text",
+    cache_path: Optional[Path] = DEFAULT_CACHE_PATH,
+    embeddings: Optional[tuple[np.ndarray, dict[str, int]]] = None,
+    band_radius: Optional[int] = None,
+) -> list[tuple[Optional[str], Optional[str]]]:
+    """``align_sequences`` for inputs already split into left/right sequences.
+
+    Skips ``_normalize_input`` and its list copies; callers such as the
+    chunked path in ``core`` pass slices straight through.
+    """
+    if embeddings is None:
+        embeddings = _embed_texts(chain(left, right), model=model, cache_path=cache_path)
+    vectors, index = embeddings
+
+    # The cost matrix is float32, so gap cells hold float32(gap_penalty). Use
+    # that same value for U/L moves too, or equal-cost paths stop tying exactly.
+    gap = float(np.float32(gap_penalty))
+    cost = _cost_matrix(left, right, vectors, index, gap)
+    lo, hi = _band_bounds(len(left), len(right), band_radius)
+    total_cost, moves = _alignment_moves(cost, gap, lo, hi)
+
+    aligned: list[tuple[Optional[str], Optional[str]]] = []
+    i = j = 0
+    for move in moves:
+        if move == _MOVE_DIAG:
+            aligned.append((left[i], right[j]))
+            i += 1
+            j += 1
+        elif move == _MOVE_UP:
+            aligned.append((left[i], None))
+            i += 1
         else:
-            raise RuntimeError(f"Backpointer missing at ({i}, {j})")
+            aligned.append((None, right[j]))
+            j += 1
 
-    aligned.reverse()
-    logger.info(f"DTW alignment complete with total cost {dp[m][n]:.4f}")
+    logger.info(f"DTW alignment complete with total cost {total_cost:.4f}")
     return aligned
@@ -6,9 +6,17 @@ Public entry point for aligning two string lists, with optional chunking + stitc
 from __future__ import annotations
 
 import argparse
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
+from multiprocessing import shared_memory
 from pathlib import Path
 from typing import Iterable, Optional, Tuple, Union
 
+import numpy as np
+
 from . import aligner
 from .stitcher import stitch_all_chunks
 
@@ -44,33 +52,132 @@ def _chunk_pairs(
         start += step
 
 
+# Per-worker view of the parent's embedding matrix, set by _init_chunk_worker.
+_worker_shm: Optional[shared_memory.SharedMemory] = None
+_worker_embeddings: Optional[tuple[np.ndarray, dict[str, int]]] = None
+
+
+def _init_chunk_worker(
+    shm_name: str, shape: tuple[int, ...], dtype: str, index: dict[str, int]
+) -> None:
+    """Attach a pool worker to the shared embedding matrix (no pickled copy)."""
+    global _worker_shm, _worker_embeddings
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    vectors = np.ndarray(shape, dtype=dtype, buffer=_worker_shm.buf)
+    _worker_embeddings = (vectors, index)
+
+
+def _align_chunk_worker(
+    chunk: tuple[list[Optional[str]], list[Optional[str]]],
+    gap_penalty: float,
+    band_radius: Optional[int],
+) -> list[tuple[Optional[str], Optional[str]]]:
+    """Align one chunk inside a pool worker using the shared embeddings."""
+    left_slice, right_slice = chunk
+    return aligner._align_sequences_normalized(
+        left_slice,
+        right_slice,
+        gap_penalty=gap_penalty,
+        embeddings=_worker_embeddings,
+        band_radius=band_radius,
+    )
+
+
+def _align_chunks_parallel(
+    chunk_inputs: list[tuple[list[Optional[str]], list[Optional[str]]]],
+    embeddings: tuple[np.ndarray, dict[str, int]],
+    gap_penalty: float,
+    band_radius: Optional[int],
+    workers: int,
+) -> list[list[tuple[Optional[str], Optional[str]]]]:
+    """Align chunks in a process pool; results come back in submission order."""
+    vectors, index = embeddings
+    shm = shared_memory.SharedMemory(create=True, size=max(vectors.nbytes, 1))
+    shared: Optional[np.ndarray] = None
+    try:
+        shared = np.ndarray(vectors.shape, dtype=vectors.dtype, buffer=shm.buf)
+        shared[...] = vectors
+        # By now the parent has usually imported litellm, which starts background
+        # threads; forking could hand workers locks held by them, so spawn fresh
+        # ones. Workers import only the DTW code, never litellm.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_chunk_worker,
+            initargs=(shm.name, vectors.shape, vectors.dtype.str, index),
+        ) as pool:
+            return list(
+                pool.map(
+                    partial(
+                        _align_chunk_worker, gap_penalty=gap_penalty, band_radius=band_radius
+                    ),
+                    chunk_inputs,
+                )
+            )
+    finally:
+        # Drop the view first: close() fails while the buffer is still exported.
+        shared = None
+        shm.close()
+        shm.unlink()
+
+
 def align_string_lists(
     input_data: AlignmentInput,
     chunk_size: Optional[int] = None,
     overlap_size: Optional[int] = None,
     gap_penalty: float = 0.1,
     model: str = "ollama/nomic-embed-text",
+    cache_path: Optional[Path] = aligner.DEFAULT_CACHE_PATH,
+    workers: Optional[int] = None,
+    band_radius: Optional[int] = None,
 ) -> list[tuple[Optional[str], Optional[str]]]:
     """
     Align two lists of strings, optionally in overlapping chunks for memory efficiency.
 
     - If chunk_size is None, a single full alignment is run.
     - If overlap_size is None (and chunking is enabled), overlap defaults to min(4, chunk_size // 2).
+    - Embeddings are cached on disk at cache_path; pass None to disable the cache.
+    - With workers > 1, chunks are aligned in a process pool that reads the
+      embedding matrix from shared memory.
+    - band_radius restricts each DTW to a Sakoe-Chiba band around the diagonal.
     """
     left, right = aligner._normalize_input(input_data)
 
     if chunk_size is None:
-        return aligner.align_sequences((left, right), gap_penalty=gap_penalty, model=model)
+        return aligner._align_sequences_normalized(
+            left,
+            right,
+            gap_penalty=gap_penalty,
+            model=model,
+            cache_path=cache_path,
+            band_radius=band_radius,
+        )
 
     if overlap_size is None:
         overlap_size = min(4, chunk_size // 2)
 
-    chunks: list[list[tuple[Optional[str], Optional[str]]]] = []
-    for left_slice, right_slice in _chunk_pairs(left, right, chunk_size, overlap_size):
-        aligned_chunk = aligner.align_sequences(
-            (left_slice, right_slice), gap_penalty=gap_penalty, model=model
+    # Slicing validates chunk_size/overlap_size, so do it before any embedding I/O.
+    chunk_inputs = list(_chunk_pairs(left, right, chunk_size, overlap_size))
+
+    # Embed every token once; overlapping chunks reuse the same matrix.
+    embeddings = aligner._embed_texts(chain(left, right), model=model, cache_path=cache_path)
+    chunks: list[list[tuple[Optional[str], Optional[str]]]]
+    if workers is not None and workers > 1 and len(chunk_inputs) > 1:
+        chunks = _align_chunks_parallel(
+            chunk_inputs, embeddings, gap_penalty, band_radius, workers
         )
-        chunks.append(aligned_chunk)
+    else:
+        chunks = [
+            aligner._align_sequences_normalized(
+                left_slice,
+                right_slice,
+                gap_penalty=gap_penalty,
+                model=model,
+                embeddings=embeddings,
+                band_radius=band_radius,
+            )
+            for left_slice, right_slice in chunk_inputs
+        ]
 
     if not chunks:
         return []
@@ -87,11 +194,14 @@ def _load_lines(path: str) -> list[str]:
 
 def _print_alignment(rows: list[tuple[Optional[str], Optional[str]]]) -> None:
     """Render an alignment table to stdout for quick inspection."""
-    max_left = max((len(item or "") for item, _ in rows), default=0)
-    for idx, (left, right) in enumerate(rows, start=1):
-        left_cell = (left or "").ljust(max_left)
-        right_cell = right or ""
-        print(f"{idx:3d}. {left_cell} | {right_cell}")
+    max_left = max(map(len, (left or "" for left, _ in rows)), default=0)
+    line = f"{{:3d}}. {{:<{max_left}}} | {{}}\n".format
+    sys.stdout.write(
+        "".join(
+            line(idx, left or "", right or "")
+            for idx, (left, right) in enumerate(rows, start=1)
+        )
+    )
 
 
 def main() -> None:
@@ -124,6 +234,29 @@ def main() -> None:
         default="ollama/nomic-embed-text",
         help="Embedding model identifier for litellm",
     )
+    parser.add_argument(
+        "--band-radius",
+        type=int,
+        default=None,
+        help="Sakoe-Chiba band radius around the diagonal (default: full DTW)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to align chunks in parallel (default: serial)",
+    )
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        default=aligner.DEFAULT_CACHE_PATH,
+        help=f"SQLite embedding cache location (default: {aligner.DEFAULT_CACHE_PATH})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always request fresh embeddings and skip the on-disk cache",
+    )
     args = parser.parse_args()
 
     left_lines = _load_lines(args.file_left)
@@ -135,6 +268,9 @@ def main() -> None:
         overlap_size=args.overlap_size,
         gap_penalty=args.gap_penalty,
         model=args.model,
+        cache_path=None if args.no_cache else args.cache_path,
+        workers=args.workers,
+        band_radius=args.band_radius,
     )
     _print_alignment(rows)
 
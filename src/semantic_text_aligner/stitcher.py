@@ -1,134 +1,272 @@
 from __future__ import annotations
 
 import argparse
-from typing import Iterable, Optional, Tuple
+import sys
+from array import array
+from itertools import chain
+from typing import TYPE_CHECKING, Optional, Tuple
 
-from loguru import logger
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 AlignedRow = Tuple[Optional[str], Optional[str]]
 
 
-def _compatible_and_merge(a: AlignedRow, b: AlignedRow) -> Optional[AlignedRow]:
-    """Return merged row if rows are compatible, otherwise None."""
-    left_a, right_a = a
-    left_b, right_b = b
-    left_conflict = left_a is not None and left_b is not None and left_a != left_b
-    right_conflict = right_a is not None and right_b is not None and right_a != right_b
-    if left_conflict or right_conflict:
-        return None
+# Token id used for a missing (None) side of a row.
+_NONE = -1
+
+
+def _intern_token(token: Optional[str], ids: dict[str, int], names: list[str]) -> int:
+    """Return the int id for ``token``, assigning the next free id on first use."""
+    if token is None:
+        return _NONE
+    token_id = ids.get(token)
+    if token_id is None:
+        token_id = ids[token] = len(names)
+        names.append(token)
+    return token_id
 
-    shared_token = (
-        (left_a is not None and left_a == left_b)
-        or (right_a is not None and right_a == right_b)
-    )
-    if not shared_token:
-        return None
 
-    merged_left = left_a if left_a is not None else left_b
-    merged_right = right_a if right_a is not None else right_b
-    return (merged_left, merged_right)
+def _encode_rows(
+    rows: Iterable[AlignedRow], ids: dict[str, int], names: list[str]
+) -> tuple[array, array]:
+    """Split (left, right) rows into parallel int id arrays."""
+    left_ids = array("i")
+    right_ids = array("i")
+    for left, right in rows:
+        left_ids.append(_intern_token(left, ids, names))
+        right_ids.append(_intern_token(right, ids, names))
+    return left_ids, right_ids
+
+
+def _decode_rows(
+    left_ids: array, right_ids: array, names: list[str]
+) -> list[AlignedRow]:
+    """Turn parallel id arrays back into (left, right) string rows."""
+    return [
+        (
+            None if left == _NONE else names[left],
+            None if right == _NONE else names[right],
+        )
+        for left, right in zip(left_ids, right_ids)
+    ]
 
 
-def _find_canonical_anchor(rows: list[AlignedRow]) -> Optional[int]:
+def _find_canonical_anchor(left_ids: array, right_ids: array) -> Optional[int]:
     """Return the index of the first row where both elements are non-None."""
-    for idx, (left, right) in enumerate(rows):
-        if left is not None and right is not None:
+    for idx, (left, right) in enumerate(zip(left_ids, right_ids)):
+        if left != _NONE and right != _NONE:
             return idx
     return None
 
 
 def _matching_overlap_length(
-    tail_window: list[AlignedRow],
-    new_chunk: list[AlignedRow],
+    tail_left: array,
+    tail_right: array,
+    new_left: array,
+    new_right: array,
     tail_idx: int,
     head_idx: int,
-) -> tuple[int, list[AlignedRow]]:
+) -> tuple[int, array, array]:
     """How many consecutive rows are compatible starting at the anchor positions.
 
     Compatibility allows upgrading gap rows when the other chunk supplies the
     missing side, as long as there are no conflicts.
     """
 
-    merged_rows: list[AlignedRow] = []
-    match_len = 0
-    while (
-        tail_idx + match_len < len(tail_window)
-        and head_idx + match_len < len(new_chunk)
-    ):
-        merged = _compatible_and_merge(
-            tail_window[tail_idx + match_len], new_chunk[head_idx + match_len]
-        )
-        if merged is None:
+    merged_left = array("i")
+    merged_right = array("i")
+    # Rows merge when they share a non-None token and neither side conflicts;
+    # checked inline because this loop runs once per overlapping row.
+    t_idx, h_idx = tail_idx, head_idx
+    t_end, h_end = len(tail_left), len(new_left)
+    while t_idx < t_end and h_idx < h_end:
+        left_a = tail_left[t_idx]
+        right_a = tail_right[t_idx]
+        left_b = new_left[h_idx]
+        right_b = new_right[h_idx]
+        if (left_a != _NONE and left_b != _NONE and left_a != left_b) or (
+            right_a != _NONE and right_b != _NONE and right_a != right_b
+        ):
             break
-        merged_rows.append(merged)
-        match_len += 1
-
-    return match_len, merged_rows
-
-
-def _trailing_permutable_block_len(window: list[AlignedRow]) -> int:
-    """Length of the trailing permutable (gap-only) block."""
-    length = 0
-    for left, right in reversed(window):
-        if (left is None) != (right is None):
-            length += 1
-        else:
+        if not (
+            (left_a != _NONE and left_a == left_b)
+            or (right_a != _NONE and right_a == right_b)
+        ):
             break
-    return length
+        merged_left.append(left_a if left_a != _NONE else left_b)
+        merged_right.append(right_a if right_a != _NONE else right_b)
+        t_idx += 1
+        h_idx += 1
+    match_len = t_idx - tail_idx
+
+    return match_len, merged_left, merged_right
+
+
+def _trailing_permutable_block_len(
+    left_ids: array, right_ids: array, start: int, end: int
+) -> int:
+    """Length of the trailing permutable (gap-only) block of rows[start:end]."""
+    idx = end - 1
+    while idx >= start and (left_ids[idx] == _NONE) != (right_ids[idx] == _NONE):
+        idx -= 1
+    return end - 1 - idx
+
+
+def _verbatim_overlap_anchor(
+    tail_left: array,
+    tail_right: array,
+    new_left: array,
+    new_right: array,
+    overlap_size: int,
+) -> Optional[int]:
+    """Anchor index when the new chunk restates the tail's last rows verbatim.
+
+    Applies when the first ``overlap_size`` rows of the new chunk equal the
+    last ``overlap_size`` rows of the tail window, the canonical anchor lies
+    among them with no (None, None) row before it, and the anchor's first
+    occurrence in the tail is its twin. The full stitch then rewrites nothing
+    and returns ``new_chunk[anchor:]`` with ``overlap_size - anchor`` rows
+    trimmed, so callers can skip it. Returns None otherwise.
+    """
+    n_tail = len(tail_left)
+    if overlap_size <= 0 or n_tail < overlap_size or len(new_left) < overlap_size:
+        return None
+    if (
+        tail_left[-overlap_size:] != new_left[:overlap_size]
+        or tail_right[-overlap_size:] != new_right[:overlap_size]
+    ):
+        return None
+
+    anchor = _find_canonical_anchor(new_left[:overlap_size], new_right[:overlap_size])
+    if anchor is None:
+        return None
+    for h_idx in range(anchor):
+        if new_left[h_idx] == _NONE and new_right[h_idx] == _NONE:
+            return None
+    anchor_left = new_left[anchor]
+    anchor_right = new_right[anchor]
+    for t_idx in range(n_tail - overlap_size + anchor):
+        if tail_left[t_idx] == anchor_left and tail_right[t_idx] == anchor_right:
+            return None
+    return anchor
 
 
 def _stitch_core(
-    prev_tail: list[AlignedRow],
-    new_chunk: list[AlignedRow],
+    prev_left: array,
+    prev_right: array,
+    new_left: array,
+    new_right: array,
     overlap_size: int,
-) -> tuple[list[AlignedRow], int, bool, bool]:
+) -> tuple[array, array, int, bool, bool]:
     """Shared core used by both public stitchers.
 
+    Rows are parallel arrays of interned token ids (``_NONE`` for a gap).
+
     Returns:
-    - stitched_rows: the combined overlap suffix plus any new rows.
+    - stitched_left, stitched_right: the combined overlap suffix plus any new rows.
     - trim_from_tail: how many rows should be removed from the accumulator tail
-      before appending stitched_rows.
+      before appending the stitched rows.
     - anchor_found: True when the canonical anchor exists in both windows.
     - anchor_present_in_head: True when the canonical anchor exists in head_window.
     """
     W_max = 2 * overlap_size
-    tail_window = prev_tail[-W_max:] if W_max > 0 else []
-    head_window = new_chunk[:W_max] if W_max > 0 else []
+    tail_left = prev_left[-W_max:] if W_max > 0 else array("i")
+    tail_right = prev_right[-W_max:] if W_max > 0 else array("i")
+    head_left = new_left[:W_max]
+    head_right = new_right[:W_max]
+    n_tail = len(tail_left)
+    n_new = len(new_left)
+
+    verbatim_anchor = _verbatim_overlap_anchor(
+        tail_left, tail_right, new_left, new_right, overlap_size
+    )
+    if verbatim_anchor is not None:
+        return (
+            new_left[verbatim_anchor:],
+            new_right[verbatim_anchor:],
+            overlap_size - verbatim_anchor,
+            True,
+            True,
+        )
 
-    anchor_idx_head = _find_canonical_anchor(head_window)
+    anchor_idx_head = _find_canonical_anchor(head_left, head_right)
     if anchor_idx_head is None:
-        return list(new_chunk), 0, False, False
-
-    anchor_row = head_window[anchor_idx_head]
+        return new_left, new_right, 0, False, False
+
+    anchor_left = head_left[anchor_idx_head]
+    anchor_right = head_right[anchor_idx_head]
+    anchor_row = (anchor_left, anchor_right)
+
+    # Seed index over the tail: exact rows and each non-None side -> positions,
+    # so anchor and prefix lookups touch only candidate rows.
+    tail_idx_map: dict[tuple[int, int], list[int]] = {}
+    left_idx_map: dict[int, list[int]] = {}
+    right_idx_map: dict[int, list[int]] = {}
+    for idx, (left, right) in enumerate(zip(tail_left, tail_right)):
+        tail_idx_map.setdefault((left, right), []).append(idx)
+        if left != _NONE:
+            left_idx_map.setdefault(left, []).append(idx)
+        if right != _NONE:
+            right_idx_map.setdefault(right, []).append(idx)
 
     def _find_anchor_in_tail() -> Optional[int]:
-        try:
-            return tail_window.index(anchor_row)
-        except ValueError:
-            for idx, row in enumerate(tail_window):
-                if _compatible_and_merge(row, anchor_row) == anchor_row:
-                    return idx
-            return None
+        exact = tail_idx_map.get(anchor_row)
+        if exact:
+            return exact[0]
+        # The anchor has both sides, so only a half-gap row holding one of its
+        # tokens upgrades to it; probe those two rows directly (first hit wins).
+        probes = [
+            tail_idx_map[probe][0]
+            for probe in ((_NONE, anchor_right), (anchor_left, _NONE))
+            if probe in tail_idx_map
+        ]
+        return min(probes, default=None)
 
     anchor_idx_tail = _find_anchor_in_tail()
     if anchor_idx_tail is None:
-        return list(new_chunk), 0, False, True
-
-    tail_prefix = tail_window[:anchor_idx_tail]
-    head_prefix = head_window[:anchor_idx_head]
+        return new_left, new_right, 0, False, True
 
-    updated_tail_window = list(tail_window)
-    consumed_head = [False] * len(head_prefix)
+    # The window slices are private copies, so merges can rewrite them in place.
+    updated_left = tail_left
+    updated_right = tail_right
+    consumed_mask = 0  # bit h set once head row h merged into the tail
     earliest_rewrite_idx: Optional[int] = None
 
-    for h_idx, head_row in enumerate(head_prefix):
-        for t_idx in range(anchor_idx_tail, -1, -1):
-            merged = _compatible_and_merge(updated_tail_window[t_idx], head_row)
-            if merged is None:
+    for h_idx in range(anchor_idx_head):
+        # Merging needs a shared token, so only rows indexed under one of the
+        # head row's tokens can match; scan them nearest-to-anchor first.
+        head_l = head_left[h_idx]
+        head_r = head_right[h_idx]
+        candidates = chain(
+            left_idx_map.get(head_l, ()) if head_l != _NONE else (),
+            right_idx_map.get(head_r, ()) if head_r != _NONE else (),
+        )
+        for t_idx in sorted(
+            (idx for idx in candidates if idx <= anchor_idx_tail), reverse=True
+        ):
+            tail_l = updated_left[t_idx]
+            tail_r = updated_right[t_idx]
+            # Candidates already share a token with the head row, so only a
+            # conflict on either side can reject the merge.
+            if (tail_l != _NONE and head_l != _NONE and tail_l != head_l) or (
+                tail_r != _NONE and head_r != _NONE and tail_r != head_r
+            ):
                 continue
-            consumed_head[h_idx] = True
-            if merged != updated_tail_window[t_idx]:
-                updated_tail_window[t_idx] = merged
+            consumed_mask |= 1 << h_idx
+            # A merge only fills a None side; index the newly filled token.
+            rewritten = False
+            if tail_l == _NONE and head_l != _NONE:
+                updated_left[t_idx] = head_l
+                left_idx_map.setdefault(head_l, []).append(t_idx)
+                rewritten = True
+            if tail_r == _NONE and head_r != _NONE:
+                updated_right[t_idx] = head_r
+                right_idx_map.setdefault(head_r, []).append(t_idx)
+                rewritten = True
+            if rewritten:
                 earliest_rewrite_idx = (
                     t_idx
                     if earliest_rewrite_idx is None
@@ -136,106 +274,204 @@ def _stitch_core(
                 )
             break
 
-    leftover_head_rows = [
-        row for used, row in zip(consumed_head, head_prefix) if not used
+    leftover = [
+        h_idx for h_idx in range(anchor_idx_head) if not consumed_mask >> h_idx & 1
     ]
 
     rewrite_idx = (
         earliest_rewrite_idx if earliest_rewrite_idx is not None else anchor_idx_tail
     )
-    start_in_prev = len(prev_tail) - len(tail_window) + rewrite_idx
-    overlap_len, merged_overlap = _matching_overlap_length(
-        updated_tail_window, new_chunk, anchor_idx_tail, anchor_idx_head
-    )
-
-    trim_from_tail = len(prev_tail) - start_in_prev
-    rewritten_prefix = updated_tail_window[rewrite_idx:anchor_idx_tail]
-    stitched_rows = (
-        leftover_head_rows
-        + rewritten_prefix
-        + merged_overlap
-        + list(new_chunk[anchor_idx_head + overlap_len :])
+    overlap_len, merged_left, merged_right = _matching_overlap_length(
+        updated_left, updated_right, new_left, new_right, anchor_idx_tail, anchor_idx_head
     )
-    return stitched_rows, trim_from_tail, True, True
+    # Everything from the earliest rewritten tail row onward is re-emitted.
+    trim_from_tail = n_tail - rewrite_idx
+
+    # Size the output once and fill it segment by segment: leftover head rows,
+    # rewritten tail prefix, merged overlap, then the rest of the new chunk.
+    suffix_start = anchor_idx_head + overlap_len
+    n_leftover = len(leftover)
+    n_rewritten = anchor_idx_tail - rewrite_idx
+    total = n_leftover + n_rewritten + overlap_len + n_new - suffix_start
+    stitched_left = array("i", [_NONE]) * total
+    stitched_right = array("i", [_NONE]) * total
+    for pos, h_idx in enumerate(leftover):
+        stitched_left[pos] = head_left[h_idx]
+        stitched_right[pos] = head_right[h_idx]
+    pos = n_leftover
+    stitched_left[pos : pos + n_rewritten] = updated_left[rewrite_idx:anchor_idx_tail]
+    stitched_right[pos : pos + n_rewritten] = updated_right[rewrite_idx:anchor_idx_tail]
+    pos += n_rewritten
+    stitched_left[pos : pos + overlap_len] = merged_left
+    stitched_right[pos : pos + overlap_len] = merged_right
+    pos += overlap_len
+    stitched_left[pos:] = new_left[suffix_start:]
+    stitched_right[pos:] = new_right[suffix_start:]
+    return stitched_left, stitched_right, trim_from_tail, True, True
 
 
 def stitch_two_chunks(
     prev_tail: list[AlignedRow],
     new_chunk: list[AlignedRow],
     overlap_size: int,
+    debug: bool = False,
 ) -> list[AlignedRow]:
     """
     Stitch a new chunk onto a tail window, returning the rows to append.
 
     The returned rows reflect the canonical anchor alignment and any overlap
-    that can safely be trimmed away.
+    that can safely be trimmed away. With ``debug=True`` the stitched rows are
+    printed to stdout.
     """
-    stitched_rows, _, _, _ = _stitch_core(prev_tail, new_chunk, overlap_size)
+    ids: dict[str, int] = {}
+    names: list[str] = []
+    prev_left, prev_right = _encode_rows(prev_tail, ids, names)
+    new_left, new_right = _encode_rows(new_chunk, ids, names)
+    stitched_left, stitched_right, _, _, _ = _stitch_core(
+        prev_left, prev_right, new_left, new_right, overlap_size
+    )
+    stitched_rows = _decode_rows(stitched_left, stitched_right, names)
+    if debug:
+        print(f"\n--- After stitch: Rows to append ({len(stitched_rows)} rows) ---")
+        _print_alignment(stitched_rows)
     return stitched_rows
 
 
-def stitch_all_chunks(
-    chunks: Iterable[list[AlignedRow]],
+def _stitch_id_chunks(
+    id_chunks: Iterable[tuple[array, array]],
     overlap_size: int,
-) -> list[AlignedRow]:
-    """
-    Stitch an iterable of aligned chunks into a single alignment.
+    debug_names: Optional[list[str]] = None,
+) -> tuple[array, array]:
+    """Stitch chunks given as (left_ids, right_ids) columns into one pair.
 
-    The accumulator is trimmed only within the tail window, keeping memory
-    bounded while preserving earlier rows.
+    Shared by stitch_all_chunks and stitch_all_chunks_int32. When
+    ``debug_names`` is given, each step is printed with ids decoded through it.
     """
-    iterator = iter(chunks)
+    iterator = iter(id_chunks)
     try:
-        first_chunk = list(next(iterator))
+        acc_left, acc_right = next(iterator)
     except StopIteration:
-        return []
+        return array("i"), array("i")
 
-    accumulator = first_chunk
     W_max = 2 * overlap_size
-    chunk_idx = 0
-
-    for chunk in iterator:
-        chunk_idx += 1
-        chunk_list = list(chunk)
-        tail_window = accumulator[-W_max:] if W_max > 0 else []
-
-        head_window = chunk_list[:W_max] if W_max > 0 else []
-        print(
-            f"\n--- Before stitch: Accumulator tail (last {min(len(accumulator), W_max)} rows) ---"
-        )
-        _print_alignment(tail_window)
-        print(
-            f"\n--- Before stitch: New chunk head (first {min(len(chunk_list), W_max)} rows) ---"
-        )
-        _print_alignment(head_window)
+    for chunk_left, chunk_right in iterator:
+        if debug_names is not None:
+            tail_start = max(len(acc_left) - W_max, 0)
+            print(
+                f"\n--- Before stitch: Accumulator tail (last {min(len(acc_left), W_max)} rows) ---"
+            )
+            _print_alignment(
+                _decode_rows(acc_left[tail_start:], acc_right[tail_start:], debug_names)
+            )
+            print(
+                f"\n--- Before stitch: New chunk head (first {min(len(chunk_left), W_max)} rows) ---"
+            )
+            _print_alignment(
+                _decode_rows(chunk_left[:W_max], chunk_right[:W_max], debug_names)
+            )
 
-        stitched_rows, trim_from_tail, anchor_found, anchor_in_head = _stitch_core(
-            tail_window, chunk_list, overlap_size
-        )
+        (
+            stitched_left,
+            stitched_right,
+            trim_from_tail,
+            anchor_found,
+            anchor_in_head,
+        ) = _stitch_core(acc_left, acc_right, chunk_left, chunk_right, overlap_size)
 
-        print(f"\n--- After stitch: Rows to append ({len(stitched_rows)} rows) ---")
-        _print_alignment(stitched_rows)
+        if debug_names is not None:
+            print(f"\n--- After stitch: Rows to append ({len(stitched_left)} rows) ---")
+            _print_alignment(_decode_rows(stitched_left, stitched_right, debug_names))
 
         if anchor_found and trim_from_tail:
-            accumulator = accumulator[:-trim_from_tail]
+            del acc_left[-trim_from_tail:]
+            del acc_right[-trim_from_tail:]
         elif not anchor_found and anchor_in_head:
-            permutable_len = _trailing_permutable_block_len(tail_window)
-            trim_len = min(permutable_len, overlap_size)
+            # Only the last overlap_size rows of the window may be trimmed, so
+            # the scan is bounded there rather than clamped afterwards.
+            acc_len = len(acc_left)
+            trim_len = _trailing_permutable_block_len(
+                acc_left, acc_right, max(acc_len - overlap_size, 0), acc_len
+            )
             if trim_len:
-                accumulator = accumulator[:-trim_len]
+                del acc_left[-trim_len:]
+                del acc_right[-trim_len:]
 
-        accumulator.extend(stitched_rows)
+        acc_left.extend(stitched_left)
+        acc_right.extend(stitched_right)
 
-    return accumulator
+    return acc_left, acc_right
+
+
+def stitch_all_chunks(
+    chunks: Iterable[list[AlignedRow]],
+    overlap_size: int,
+    debug: bool = False,
+) -> list[AlignedRow]:
+    """
+    Stitch an iterable of aligned chunks into a single alignment.
+
+    The accumulator is trimmed only within the tail window, keeping memory
+    bounded while preserving earlier rows: trims and appends happen in place
+    on the id arrays, so each chunk costs O(window + chunk) rather than a copy
+    of everything stitched so far. Tokens are interned to int ids for
+    the duration of the call and decoded back to strings on return. With
+    ``debug=True`` each step's tail window, chunk head and stitched rows are
+    printed to stdout.
+    """
+    ids: dict[str, int] = {}
+    names: list[str] = []
+    acc_left, acc_right = _stitch_id_chunks(
+        (_encode_rows(chunk, ids, names) for chunk in chunks),
+        overlap_size,
+        debug_names=names if debug else None,
+    )
+    return _decode_rows(acc_left, acc_right, names)
+
+
+def _id_columns(chunk: np.ndarray) -> tuple[array, array]:
+    """Split an ``(n, 2)`` token-id array into left/right id columns."""
+    ids = np.asarray(chunk)
+    if ids.ndim != 2 or ids.shape[1] != 2:
+        raise ValueError(
+            f"chunks must be (n, 2) arrays of token ids, got shape {ids.shape}"
+        )
+    left_ids = array("i")
+    right_ids = array("i")
+    left_ids.frombytes(np.ascontiguousarray(ids[:, 0], dtype=np.intc).view(np.uint8))
+    right_ids.frombytes(np.ascontiguousarray(ids[:, 1], dtype=np.intc).view(np.uint8))
+    return left_ids, right_ids
+
+
+def stitch_all_chunks_int32(
+    chunks: Iterable[np.ndarray],
+    overlap_size: int,
+) -> np.ndarray:
+    """
+    Stitch chunks that are already encoded as token ids.
+
+    Each chunk is an ``(n, 2)`` integer array of (left, right) ids with -1
+    marking a gap, for callers that intern tokens themselves; no string is
+    touched. Returns the stitched rows as an ``(n, 2)`` int32 array.
+    """
+    acc_left, acc_right = _stitch_id_chunks(
+        (_id_columns(chunk) for chunk in chunks), overlap_size
+    )
+    stitched = np.column_stack(
+        (np.frombuffer(acc_left, dtype=np.intc), np.frombuffer(acc_right, dtype=np.intc))
+    )
+    return stitched.astype(np.int32, copy=False)
 
 
 def _print_alignment(rows: list[AlignedRow]) -> None:
     """Render an alignment table to stdout for quick inspection."""
-    max_left = max((len(item or "") for item, _ in rows), default=0)
-    for idx, (left, right) in enumerate(rows, start=1):
-        left_cell = (left or "").ljust(max_left)
-        right_cell = right or ""
-        print(f"{idx:3d}. {left_cell} | {right_cell}")
+    max_left = max(map(len, (left or "" for left, _ in rows)), default=0)
+    line = f"{{:3d}}. {{:<{max_left}}} | {{}}\n".format
+    sys.stdout.write(
+        "".join(
+            line(idx, left or "", right or "")
+            for idx, (left, right) in enumerate(rows, start=1)
+        )
+    )
 
 
 def main() -> None:
@@ -275,6 +511,9 @@ def main() -> None:
     )
     args = parser.parse_args()
 
+    # loguru is only needed by the CLI, so library imports skip it
+    from loguru import logger
+
     # Configure loguru logger
     logger.remove()
     logger.add(
@@ -331,7 +570,9 @@ def main() -> None:
     logger.info("Starting stitch_all_chunks")
     logger.info(f"{'=' * 80}")
 
-    stitched_result = stitch_all_chunks(alignments, overlap_size=args.overlap_size)
+    stitched_result = stitch_all_chunks(
+        alignments, overlap_size=args.overlap_size, debug=args.log_level == "DEBUG"
+    )
 
     logger.info(f"\n{'=' * 80}")
     logger.info("Stitching complete")
@@ -0,0 +1,14 @@
+import os
+import sys
+
+# Make the src/ layout (and tests.fixtures helpers) importable once per test
+# session. abspath is string-only normalization, unlike Path.resolve(), which
+# lstat()s every path component.
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for _path in (os.path.join(_ROOT, "src"), _ROOT):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+# Tests never reach the network: keep litellm's import from fetching the
+# remote model cost map (offline, that fetch can break the import).
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
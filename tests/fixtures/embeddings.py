@@ -0,0 +1,16 @@
+"""
+Seeded embedding matrices for tests that bypass litellm.
+"""
+
+import numpy as np
+
+
+def random_embeddings(count: int, seed: int = 0) -> tuple[np.ndarray, dict[str, int]]:
+    """Unit vectors for tokens ``t0..t{count-1}``, shaped like _embed_texts output.
+
+    Distinct tokens are never equidistant, so alignments over them do not tie.
+    """
+    rng = np.random.default_rng(seed)
+    matrix = rng.normal(size=(count, 8)).astype(np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix, {f"t{row}": row for row in range(count)}
@@ -5,8 +5,6 @@ Each fixture is defined in its own module as a single AlignmentCase instance
 named CASE for easy discovery/import in tests.
 """
 
-import csv
-import io
 from dataclasses import dataclass
 from typing import Optional
 
@@ -35,18 +33,17 @@ class AlignmentIO:
             right: List of right-side strings (or None for gaps)
         """
         if isinstance(left_or_text, str):
-            # Parse CSV string
-            reader = csv.reader(io.StringIO(left_or_text))
+            # Parse CSV string; fixtures never quote fields, so a plain split suffices
             parsed_left = []
             parsed_right = []
-            for row in reader:
-                if len(row) >= 2:
-                    parsed_left.append(row[0].strip() if row[0].strip() else None)
-                    parsed_right.append(row[1].strip() if row[1].strip() else None)
-                elif len(row) == 1:
-                    # Single column - treat as left, right is None
-                    parsed_left.append(row[0].strip() if row[0].strip() else None)
-                    parsed_right.append(None)
+            for line in left_or_text.splitlines():
+                if not line:
+                    continue
+                # A single column is treated as left, with right None
+                fields = line.split(",", 2)
+                right_field = fields[1].strip() if len(fields) > 1 else ""
+                parsed_left.append(fields[0].strip() or None)
+                parsed_right.append(right_field or None)
             self.left = parsed_left
             self.right = parsed_right
         elif isinstance(left_or_text, list) and right is not None:
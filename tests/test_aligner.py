@@ -0,0 +1,334 @@
+import asyncio
+import base64
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+import warnings
+from collections import OrderedDict
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+from unittest import mock
+
+import numpy as np
+
+from semantic_text_aligner import aligner
+from semantic_text_aligner.aligner import align_sequences
+from tests.fixtures.embeddings import random_embeddings
+
+
+def _embeddings(vectors: dict[str, list[float]]) -> tuple[np.ndarray, dict[str, int]]:
+    """Build precomputed embeddings in the shape returned by _embed_texts."""
+    index = {text: row for row, text in enumerate(vectors)}
+    matrix = np.array(list(vectors.values()), dtype=np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix, index
+
+
+EMBEDDINGS = _embeddings(
+    {
+        "apple": [1.0, 0.0, 0.0],
+        "apples": [0.99, 0.1, 0.0],
+        "boat": [0.0, 1.0, 0.0],
+        "ship": [0.05, 0.99, 0.0],
+        "cloud": [0.0, 0.0, 1.0],
+    }
+)
+
+
+RANDOM_EMBEDDINGS = random_embeddings(40)
+# Right side inserts three tokens and each side has a None, so the optimal
+# path mixes diagonal, up and left moves.
+RANDOM_LEFT: list[Optional[str]] = [f"t{row}" for row in range(24)]
+RANDOM_LEFT.insert(9, None)
+RANDOM_RIGHT: list[Optional[str]] = [f"t{row}" for row in range(24)]
+for _at in (20, 13, 5):
+    RANDOM_RIGHT.insert(_at, f"t{24 + _at}")
+RANDOM_RIGHT.insert(17, None)
+
+
+class AlignSequencesTest(unittest.TestCase):
+    def test_similar_tokens_pair_up(self) -> None:
+        result = align_sequences(
+            (["apple", "boat"], ["apples", "ship"]), embeddings=EMBEDDINGS
+        )
+
+        self.assertEqual(result, [("apple", "apples"), ("boat", "ship")])
+
+    def test_unmatched_token_becomes_gap(self) -> None:
+        result = align_sequences(
+            (["apple", "cloud", "boat"], ["apples", "ship"]), embeddings=EMBEDDINGS
+        )
+
+        self.assertEqual(
+            result,
+            [("apple", "apples"), ("cloud", None), ("boat", "ship")],
+        )
+
+    def test_none_inputs(self) -> None:
+        result = align_sequences(
+            [("apple", "apples"), (None, None), ("boat", "ship")],
+            embeddings=EMBEDDINGS,
+        )
+
+        self.assertEqual(
+            result,
+            [("apple", "apples"), (None, None), ("boat", "ship")],
+        )
+
+    def test_gap_ties_prefer_diagonal_with_none_tokens(self) -> None:
+        # Pairing a token with None and a pair of gap moves cost the same; the
+        # tie must break towards the diagonal, as with the float64 baseline.
+        result = align_sequences(
+            ([None, "apple"], ["boat", None]), gap_penalty=0.3, embeddings=EMBEDDINGS
+        )
+
+        self.assertEqual(result, [(None, "boat"), ("apple", None)])
+
+    def test_token_without_embedding_costs_gap(self) -> None:
+        result = align_sequences(
+            (["apple", "mystery"], ["apples"]), gap_penalty=0.3, embeddings=EMBEDDINGS
+        )
+
+        self.assertEqual(result, [("apple", "apples"), ("mystery", None)])
+
+    def test_band_keeps_near_diagonal_alignment(self) -> None:
+        pair = (["apple", "cloud", "boat"], ["apples", "ship"])
+
+        self.assertEqual(
+            align_sequences(pair, embeddings=EMBEDDINGS, band_radius=0),
+            align_sequences(pair, embeddings=EMBEDDINGS),
+        )
+
+    def test_negative_band_radius_rejected(self) -> None:
+        for pair in ((["apple"], ["boat"]), ([], ["boat"])):
+            with self.assertRaises(ValueError):
+                align_sequences(pair, embeddings=EMBEDDINGS, band_radius=-1)
+
+    def test_empty_side(self) -> None:
+        self.assertEqual(
+            align_sequences(([], ["boat", "ship"]), embeddings=EMBEDDINGS),
+            [(None, "boat"), (None, "ship")],
+        )
+        self.assertEqual(align_sequences(([], []), embeddings=EMBEDDINGS), [])
+
+
+@contextmanager
+def _numpy_fill() -> Iterator[None]:
+    """Force the NumPy fill and pure-Python traceback even when numba is installed."""
+    with mock.patch.object(aligner, "_dtw_fill_numba", None), mock.patch.object(
+        aligner, "_traceback_numba", None
+    ):
+        yield
+
+
+def _fills() -> dict[str, Callable[[], AbstractContextManager]]:
+    fills: dict[str, Callable[[], AbstractContextManager]] = {"numpy": _numpy_fill}
+    if aligner._dtw_fill_numba is not None:
+        fills["numba"] = nullcontext
+    return fills
+
+
+class DtwFillTest(unittest.TestCase):
+    def test_fills_match_scalar_reference(self) -> None:
+        gap = 0.4
+        cost = aligner._cost_matrix(RANDOM_LEFT, RANDOM_RIGHT, *RANDOM_EMBEDDINGS, gap)
+        for band_radius in (None, 2):
+            lo, hi = aligner._band_bounds(*cost.shape, band_radius)
+            expected_cost, expected_back = aligner._dtw_fill_loops(cost, gap, lo, hi)
+            # Backpointers outside the band are never read and may hold anything.
+            columns = np.arange(cost.shape[1] + 1)
+            in_band = (columns >= lo[:, None]) & (columns <= hi[:, None])
+            for name, fill in _fills().items():
+                with self.subTest(fill=name, band_radius=band_radius), fill():
+                    total_cost, back = aligner._dtw_fill(cost, gap, lo, hi)
+                    self.assertAlmostEqual(total_cost, expected_cost)
+                    np.testing.assert_array_equal(back[in_band], expected_back[in_band])
+
+    def test_hirschberg_split_matches_full_traceback(self) -> None:
+        gap = 0.4
+        cost = aligner._cost_matrix(RANDOM_LEFT, RANDOM_RIGHT, *RANDOM_EMBEDDINGS, gap)
+        for band_radius in (None, 2):
+            lo, hi = aligner._band_bounds(*cost.shape, band_radius)
+            expected_cost, expected_moves = aligner._alignment_moves(cost, gap, lo, hi)
+            for name, fill in _fills().items():
+                # Small enough that the split recurses several levels deep.
+                with self.subTest(fill=name, band_radius=band_radius), fill(), mock.patch.object(
+                    aligner, "_MAX_BACK_CELLS", 20
+                ):
+                    total_cost, moves = aligner._alignment_moves(cost, gap, lo, hi)
+                    self.assertAlmostEqual(total_cost, expected_cost)
+                    self.assertEqual(moves, expected_moves)
+
+
+class EmbedTextsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = mock.patch.object(aligner, "_memory_cache", OrderedDict())
+        self.memory_cache = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_memory_cache_rows_own_their_data(self) -> None:
+        raw = [np.array([3.0, 4.0], dtype=np.float32), np.array([0.0, 2.0], dtype=np.float32)]
+        with mock.patch.object(aligner, "_fetch_embeddings", return_value=raw):
+            vectors, index = aligner._embed_texts(["a", "b"], model="m", cache_path=None)
+
+        np.testing.assert_allclose(vectors, [[0.6, 0.8], [0.0, 1.0]])
+        self.assertEqual(index, {"a": 0, "b": 1})
+        for vec in self.memory_cache.values():
+            self.assertIsNone(vec.base)
+
+
+def _fake_vector(text: str) -> list[float]:
+    """Deterministic raw embedding for ``t<k>`` tokens."""
+    return [float(text[1:]), 1.0, 0.5]
+
+
+def _fake_response(texts: list[str], base64_payload: bool = False) -> dict:
+    if base64_payload:
+        vectors = [
+            base64.b64encode(np.array(_fake_vector(text), dtype=np.float32).tobytes()).decode()
+            for text in texts
+        ]
+    else:
+        vectors = [_fake_vector(text) for text in texts]
+    return {"data": [{"embedding": vec} for vec in vectors]}
+
+
+class _EmbeddingsHandler(BaseHTTPRequestHandler):
+    """Minimal OpenAI-compatible /embeddings endpoint serving _fake_vector rows."""
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        response = _fake_response(
+            body["input"], base64_payload=body.get("encoding_format") == "base64"
+        )
+        for row, record in enumerate(response["data"]):
+            record.update(object="embedding", index=row)
+        response.update(
+            object="list", model=body["model"], usage={"prompt_tokens": 1, "total_tokens": 1}
+        )
+        payload = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class EmbeddingRequestTest(unittest.TestCase):
+    def test_disk_cache_hit_skips_request(self) -> None:
+        texts = ["t1", "t2", "t3"]
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "embeds.sqlite"
+            with mock.patch(
+                "litellm.embedding", side_effect=lambda model, input: _fake_response(input)
+            ) as request:
+                first = aligner._fetch_embeddings(texts, "m", cache_path)
+            self.assertEqual(request.call_count, 1)
+
+            with mock.patch("litellm.embedding") as request:
+                second = aligner._fetch_embeddings(texts, "m", cache_path)
+            request.assert_not_called()
+
+            with mock.patch(
+                "litellm.embedding", side_effect=lambda model, input: _fake_response(input)
+            ) as request:
+                aligner._fetch_embeddings(["t2", "t4"], "m", cache_path)
+            request.assert_called_once_with(model="m", input=["t4"])
+
+        np.testing.assert_array_equal(np.stack(second), np.stack(first))
+        np.testing.assert_array_equal(
+            np.stack(second), np.array([_fake_vector(text) for text in texts], dtype=np.float32)
+        )
+
+    def test_cache_errors_fall_back_to_requests(self) -> None:
+        texts = ["t1", "t2"]
+        locked = sqlite3.OperationalError("database is locked")
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "embeds.sqlite"
+            for broken in ("_cache_load", "_cache_store"):
+                with self.subTest(broken=broken), mock.patch.object(
+                    aligner, broken, side_effect=locked
+                ), mock.patch(
+                    "litellm.embedding", side_effect=lambda model, input: _fake_response(input)
+                ) as request:
+                    vectors = aligner._fetch_embeddings(texts, "m", cache_path)
+                    request.assert_called_once_with(model="m", input=texts)
+                    np.testing.assert_array_equal(
+                        np.stack(vectors),
+                        np.array([_fake_vector(text) for text in texts], dtype=np.float32),
+                    )
+
+    def test_batches_are_split_and_reassembled_in_order(self) -> None:
+        texts = [f"t{k}" for k in range(10)]
+
+        async def _respond(model: str, input: list[str]) -> dict:
+            # Later batches finish first, so gather order is what keeps rows in place.
+            await asyncio.sleep(0.01 * (10 - int(input[0][1:])) / 10)
+            return _fake_response(input)
+
+        with mock.patch("litellm.aembedding", side_effect=_respond) as request:
+            matrix = aligner._request_embeddings(texts, "m", batch_size=3, concurrency=4)
+
+        self.assertEqual(
+            [call.kwargs["input"] for call in request.call_args_list],
+            [texts[0:3], texts[3:6], texts[6:9], texts[9:10]],
+        )
+        self.assertEqual(matrix.dtype, np.float32)
+        np.testing.assert_array_equal(
+            matrix, np.array([_fake_vector(text) for text in texts], dtype=np.float32)
+        )
+
+    def test_base64_payload_decodes_to_float32_vectors(self) -> None:
+        texts = ["t7", "t8"]
+        model = "openai/text-embedding-3-small"
+        self.assertEqual(aligner._embedding_kwargs(model), {"encoding_format": "base64"})
+        self.assertEqual(aligner._embedding_kwargs("ollama/nomic-embed-text"), {})
+
+        def _respond(model: str, input: list[str], encoding_format: str) -> dict:
+            self.assertEqual(encoding_format, "base64")
+            return _fake_response(input, base64_payload=True)
+
+        with mock.patch("litellm.embedding", side_effect=_respond):
+            matrix = aligner._request_embeddings(texts, model)
+
+        np.testing.assert_array_equal(
+            matrix, np.array([_fake_vector(text) for text in texts], dtype=np.float32)
+        )
+
+    def test_base64_requests_emit_no_warnings(self) -> None:
+        server = HTTPServer(("127.0.0.1", 0), _EmbeddingsHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        env = {
+            "OPENAI_API_KEY": "test",
+            "OPENAI_BASE_URL": f"http://127.0.0.1:{server.server_port}/v1",
+        }
+        texts = [f"t{k}" for k in range(5)]
+
+        # batch_size=2 takes the concurrent path, 5 the single sequential request.
+        for batch_size in (2, 5):
+            with self.subTest(batch_size=batch_size), mock.patch.dict(
+                os.environ, env
+            ), warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                matrix = aligner._request_embeddings(
+                    texts, "openai/text-embedding-3-small", batch_size=batch_size
+                )
+
+                self.assertEqual([str(warning.message) for warning in caught], [])
+                np.testing.assert_array_equal(
+                    matrix, np.array([_fake_vector(text) for text in texts], dtype=np.float32)
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
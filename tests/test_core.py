@@ -0,0 +1,47 @@
+import unittest
+from typing import Optional
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from semantic_text_aligner import aligner
+from semantic_text_aligner.core import _align_chunks_parallel, align_string_lists
+from tests.fixtures.embeddings import random_embeddings
+
+
+EMBEDDINGS = random_embeddings(60)
+LEFT: list[Optional[str]] = [f"t{row}" for row in range(40)]
+RIGHT: list[Optional[str]] = [f"t{row}" for row in range(40) if row % 7 != 3]
+RIGHT.insert(12, "t45")
+RIGHT.insert(30, None)
+
+
+class AlignStringListsTest(unittest.TestCase):
+    @pytest.mark.slow
+    def test_parallel_chunks_match_serial(self) -> None:
+        # Only the parent embeds; spawned workers read the matrix from shared memory.
+        with mock.patch.object(aligner, "_embed_texts", return_value=EMBEDDINGS):
+            serial = align_string_lists((LEFT, RIGHT), chunk_size=10, overlap_size=3)
+            parallel = align_string_lists(
+                (LEFT, RIGHT), chunk_size=10, overlap_size=3, workers=2
+            )
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual([left for left, _ in serial if left is not None], LEFT)
+
+    def test_invalid_chunking_rejected_before_embedding(self) -> None:
+        with mock.patch.object(aligner, "_embed_texts") as embed:
+            for kwargs in ({"chunk_size": 0}, {"chunk_size": 4, "overlap_size": -1}):
+                with self.subTest(**kwargs), self.assertRaises(ValueError):
+                    align_string_lists((LEFT, RIGHT), **kwargs)
+        embed.assert_not_called()
+
+    def test_shared_memory_failure_is_not_masked(self) -> None:
+        with mock.patch.object(np, "ndarray", side_effect=MemoryError("no view")):
+            with self.assertRaisesRegex(MemoryError, "no view"):
+                _align_chunks_parallel([], EMBEDDINGS, 0.1, None, workers=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,266 +1,328 @@
-import sys
-import unittest
-from pathlib import Path
+from sys import intern
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+import numpy as np
+import pytest
 
-from semantic_text_aligner.stitcher import stitch_all_chunks  # noqa: E402
+from semantic_text_aligner.stitcher import stitch_all_chunks, stitch_all_chunks_int32
 from semantic_text_aligner.stitcher import stitch_two_chunks
 
+# Recurring fixture sentences, interned so every occurrence is one object and
+# tuple equality hits the identity fast path.
+_EMERGENCY_FULL = intern(
+    "create a list of emergency contacts and distribute it to family members"
+)
+_EMERGENCY = intern("create a list of emergency contacts")
+_DISTRIBUTE = intern("distribute it to family members")
+_STORIES_FULL = intern("share stories and memories with family members")
+_STORIES = intern("share stories and memories")
+_BOUNDARIES = intern("set boundaries for personal time")
+_RECIPES_FULL = intern("share and teach family recipes to the next generation")
+_RECIPES = intern("share and teach family recipes")
+_CHAPTER = intern("read a chapter from a book")
+_DINNER = intern("plan and cook a healthy dinner")
 
-class StitcherExamplesTest(unittest.TestCase):
-    def test_trivial_no_overlap(self) -> None:
-        chunk_a = [
-            ("a", "x"),
-            ("b", "y"),
-        ]
-        chunk_b = [("c", "z")]
-
-        result = stitch_all_chunks([chunk_a, chunk_b], overlap_size=0)
-
-        self.assertEqual(
-            result,
-            [
-                ("a", "x"),
-                ("b", "y"),
-                ("c", "z"),
-            ],
-        )
-
-    def test_simple_edge_stitch(self) -> None:
-        chunk_a = [
-            ("a", "x"),
-            ("b", "y"),
-            ("c", "z"),
-            ("d", None),
-        ]
-        chunk_b = [
-            ("c", "z"),
-            ("d", None),
-            ("e", "w"),
-        ]
-
-        result = stitch_all_chunks([chunk_a, chunk_b], overlap_size=2)
-
-        self.assertEqual(
-            result,
-            [
-                ("a", "x"),
-                ("b", "y"),
-                ("c", "z"),
-                ("d", None),
-                ("e", "w"),
-            ],
-        )
-
-    def test_gap_block_permutation(self) -> None:
-        chunk_1 = [
-            ("dog", None),
-            (None, "cat"),
-            ("pizza", None),
-            (None, "mouse"),
-        ]
-        chunk_2 = [
-            (None, "mouse"),
-            ("pizza", "pizza pie"),
-            ("house", None),
-        ]
-
-        result = stitch_all_chunks([chunk_1, chunk_2], overlap_size=2)
-
-        self.assertEqual(
-            result,
-            [
-                ("dog", None),
-                (None, "cat"),
-                (None, "mouse"),
-                ("pizza", "pizza pie"),
-                ("house", None),
-            ],
-        )
-
-    def test_complex_gap_block_permutation(self) -> None:
-        chunk_a = [
-            ("a", None),
-            ("b", None),
-            (None, "x"),
-            (None, "y"),
-            ("c", "z"),
-            ("d", "w"),
-        ]
-        chunk_b = [
-            (None, "y"),
-            (None, "x"),
-            ("a", None),
-            ("b", None),
-            ("c", "z"),
-            ("d", "w"),
-            ("e", None),
-        ]
-
-        result = stitch_all_chunks([chunk_a, chunk_b], overlap_size=3)
-
-        self.assertEqual(
-            result,
-            [
-                ("a", None),
-                ("b", None),
-                (None, "x"),
-                (None, "y"),
-                ("c", "z"),
-                ("d", "w"),
-                ("e", None),
-            ],
-        )
-
-    def test_no_canonical_anchor(self) -> None:
-        tail = [
-            ("a", None),
-            (None, "b"),
-        ]
-        chunk = [
-            (None, "c"),
-            (None, "d"),
-        ]
-
-        stitched = stitch_two_chunks(tail, chunk, overlap_size=1)
-        self.assertEqual(stitched, chunk)
-
-    def test_overlap_upgrades_gap_row(self) -> None:
-        chunk_a = [
-            (
-                "create a list of emergency contacts and distribute it to family members",
-                "create a list of emergency contacts",
-            ),
-            (None, "distribute it to family members"),
-            (
-                "share stories and memories with family members",
-                "share stories and memories",
-            ),
-            ("set boundaries for personal time", None),
-        ]
-        chunk_b = [
-            (None, "distribute it to family members"),
-            (
-                "share stories and memories with family members",
-                "share stories and memories",
-            ),
-            ("set boundaries for personal time", "set boundaries for personal time"),
-            (
-                "share and teach family recipes to the next generation",
-                "share and teach family recipes",
-            ),
-            ("read a chapter from a book", None),
-        ]
-
-        stitched = stitch_all_chunks([chunk_a, chunk_b], overlap_size=2)
-
-        self.assertEqual(
-            stitched,
-            [
-                (
-                    "create a list of emergency contacts and distribute it to family members",
-                    "create a list of emergency contacts",
-                ),
-                (None, "distribute it to family members"),
-                (
-                    "share stories and memories with family members",
-                    "share stories and memories",
-                ),
-                (
-                    "set boundaries for personal time",
-                    "set boundaries for personal time",
-                ),
-                (
-                    "share and teach family recipes to the next generation",
-                    "share and teach family recipes",
-                ),
-                ("read a chapter from a book", None),
-            ],
-        )
-
-    def test_permutable_gap_block_with_upgrade(self) -> None:
-        chunk_a = [
-            ("X", "y"),
-            ("A", None),
-            (None, "B"),
-            ("C", None),
-        ]
-        chunk_b = [
-            (None, "B"),
-            ("A", None),
-            ("C", "c"),
-            ("Z", "w"),
-        ]
-
-        stitched = stitch_all_chunks([chunk_a, chunk_b], overlap_size=2)
-
-        self.assertEqual(
-            stitched,
-            [
-                ("X", "y"),
-                ("A", None),
-                (None, "B"),
-                ("C", "c"),
-                ("Z", "w"),
-            ],
-        )
-
-    def test_head_gap_row_absorbed_by_full_tail_row(self) -> None:
-        chunk_a = [
-            (
-                "create a list of emergency contacts and distribute it to family members",
-                "create a list of emergency contacts",
-            ),
-            (None, "distribute it to family members"),
-            (
-                "share stories and memories with family members",
-                "share stories and memories",
-            ),
-            ("set boundaries for personal time", "set boundaries for personal time"),
-            (
-                "share and teach family recipes to the next generation",
-                "share and teach family recipes",
-            ),
-            ("read a chapter from a book", None),
-        ]
-        chunk_b = [
-            (None, "set boundaries for personal time"),
-            (
-                "share and teach family recipes to the next generation",
-                "share and teach family recipes",
-            ),
-            ("read a chapter from a book", "read a chapter from a book"),
-            ("plan and cook a healthy dinner", "plan and cook a healthy dinner"),
-        ]
-
-        stitched = stitch_all_chunks([chunk_a, chunk_b], overlap_size=2)
-
-        self.assertEqual(
-            stitched,
-            [
-                (
-                    "create a list of emergency contacts and distribute it to family members",
-                    "create a list of emergency contacts",
-                ),
-                (None, "distribute it to family members"),
-                (
-                    "share stories and memories with family members",
-                    "share stories and memories",
-                ),
-                (
-                    "set boundaries for personal time",
-                    "set boundaries for personal time",
-                ),
-                (
-                    "share and teach family recipes to the next generation",
-                    "share and teach family recipes",
-                ),
-                ("read a chapter from a book", "read a chapter from a book"),
-                ("plan and cook a healthy dinner", "plan and cook a healthy dinner"),
-            ],
-        )
+# Rows shared by the long-sentence fixtures, so every chunk references one object.
+_ROW_EMERGENCY = (_EMERGENCY_FULL, _EMERGENCY)
+_ROW_DISTRIBUTE_GAP = (None, _DISTRIBUTE)
+_ROW_STORIES = (_STORIES_FULL, _STORIES)
+_ROW_BOUNDARIES = (_BOUNDARIES, _BOUNDARIES)
+_ROW_RECIPES = (_RECIPES_FULL, _RECIPES)
+_ROW_CHAPTER_GAP = (_CHAPTER, None)
+_ROW_CHAPTER = (_CHAPTER, _CHAPTER)
+_ROW_DINNER = (_DINNER, _DINNER)
+
+# Fixtures are built once at import time; the stitcher only iterates its
+# inputs, so tests pass these tuples straight through.
+_TRIVIAL_CHUNK_A = (
+    ("a", "x"),
+    ("b", "y"),
+)
+_TRIVIAL_CHUNK_B = (("c", "z"),)
+_TRIVIAL_EXPECTED = (
+    ("a", "x"),
+    ("b", "y"),
+    ("c", "z"),
+)
+
+_EDGE_CHUNK_A = (
+    ("a", "x"),
+    ("b", "y"),
+    ("c", "z"),
+    ("d", None),
+)
+_EDGE_CHUNK_B = (
+    ("c", "z"),
+    ("d", None),
+    ("e", "w"),
+)
+_EDGE_EXPECTED = (
+    ("a", "x"),
+    ("b", "y"),
+    ("c", "z"),
+    ("d", None),
+    ("e", "w"),
+)
+
+_GAP_BLOCK_CHUNK_1 = (
+    ("dog", None),
+    (None, "cat"),
+    ("pizza", None),
+    (None, "mouse"),
+)
+_GAP_BLOCK_CHUNK_2 = (
+    (None, "mouse"),
+    ("pizza", "pizza pie"),
+    ("house", None),
+)
+_GAP_BLOCK_EXPECTED = (
+    ("dog", None),
+    (None, "cat"),
+    (None, "mouse"),
+    ("pizza", "pizza pie"),
+    ("house", None),
+)
+
+_COMPLEX_GAP_CHUNK_A = (
+    ("a", None),
+    ("b", None),
+    (None, "x"),
+    (None, "y"),
+    ("c", "z"),
+    ("d", "w"),
+)
+_COMPLEX_GAP_CHUNK_B = (
+    (None, "y"),
+    (None, "x"),
+    ("a", None),
+    ("b", None),
+    ("c", "z"),
+    ("d", "w"),
+    ("e", None),
+)
+_COMPLEX_GAP_EXPECTED = (
+    ("a", None),
+    ("b", None),
+    (None, "x"),
+    (None, "y"),
+    ("c", "z"),
+    ("d", "w"),
+    ("e", None),
+)
+
+_NO_ANCHOR_TAIL = (
+    ("a", None),
+    (None, "b"),
+)
+_NO_ANCHOR_CHUNK = (
+    (None, "c"),
+    (None, "d"),
+)
+
+_UPGRADE_CHUNK_A = (
+    _ROW_EMERGENCY,
+    _ROW_DISTRIBUTE_GAP,
+    _ROW_STORIES,
+    (_BOUNDARIES, None),
+)
+_UPGRADE_CHUNK_B = (
+    _ROW_DISTRIBUTE_GAP,
+    _ROW_STORIES,
+    _ROW_BOUNDARIES,
+    _ROW_RECIPES,
+    _ROW_CHAPTER_GAP,
+)
+_UPGRADE_EXPECTED = (
+    _ROW_EMERGENCY,
+    _ROW_DISTRIBUTE_GAP,
+    _ROW_STORIES,
+    _ROW_BOUNDARIES,
+    _ROW_RECIPES,
+    _ROW_CHAPTER_GAP,
+)
+
+_PERMUTABLE_CHUNK_A = (
+    ("X", "y"),
+    ("A", None),
+    (None, "B"),
+    ("C", None),
+)
+_PERMUTABLE_CHUNK_B = (
+    (None, "B"),
+    ("A", None),
+    ("C", "c"),
+    ("Z", "w"),
+)
+_PERMUTABLE_EXPECTED = (
+    ("X", "y"),
+    ("A", None),
+    (None, "B"),
+    ("C", "c"),
+    ("Z", "w"),
+)
+
+# The absorbed-row case continues from the upgrade case's stitched output.
+_ABSORBED_CHUNK_A = _UPGRADE_EXPECTED
+_ABSORBED_CHUNK_B = (
+    (None, _BOUNDARIES),
+    _ROW_RECIPES,
+    _ROW_CHAPTER,
+    _ROW_DINNER,
+)
+_ABSORBED_EXPECTED = (
+    _ROW_EMERGENCY,
+    _ROW_DISTRIBUTE_GAP,
+    _ROW_STORIES,
+    _ROW_BOUNDARIES,
+    _ROW_RECIPES,
+    _ROW_CHAPTER,
+    _ROW_DINNER,
+)
+
+# The new chunk restates the tail's last two rows, a gap row then the anchor.
+_VERBATIM_CHUNK_A = (
+    ("a", "x"),
+    ("b", "y"),
+    (None, "q"),
+    ("c", "z"),
+)
+_VERBATIM_CHUNK_B = (
+    (None, "q"),
+    ("c", "z"),
+    ("d", "w"),
+)
+_VERBATIM_EXPECTED = (
+    ("a", "x"),
+    ("b", "y"),
+    (None, "q"),
+    ("c", "z"),
+    ("d", "w"),
+)
+
+# The head's anchor never appears in the tail, so the tail's trailing
+# gap-only block is dropped before the new chunk is appended.
+_TAIL_TRIM_CHUNK_A = (
+    ("a", "x"),
+    ("b", "y"),
+    (None, "q"),
+    ("p", None),
+)
+_TAIL_TRIM_CHUNK_B = (
+    ("c", "z"),
+    ("d", "w"),
+)
+_TAIL_TRIM_EXPECTED = (
+    ("a", "x"),
+    ("b", "y"),
+    ("c", "z"),
+    ("d", "w"),
+)
+
+
+_CASES = (
+    ("trivial_no_overlap", (_TRIVIAL_CHUNK_A, _TRIVIAL_CHUNK_B), 0, _TRIVIAL_EXPECTED),
+    ("simple_edge_stitch", (_EDGE_CHUNK_A, _EDGE_CHUNK_B), 2, _EDGE_EXPECTED),
+    (
+        "gap_block_permutation",
+        (_GAP_BLOCK_CHUNK_1, _GAP_BLOCK_CHUNK_2),
+        2,
+        _GAP_BLOCK_EXPECTED,
+    ),
+    (
+        "complex_gap_block_permutation",
+        (_COMPLEX_GAP_CHUNK_A, _COMPLEX_GAP_CHUNK_B),
+        3,
+        _COMPLEX_GAP_EXPECTED,
+    ),
+    (
+        "overlap_upgrades_gap_row",
+        (_UPGRADE_CHUNK_A, _UPGRADE_CHUNK_B),
+        2,
+        _UPGRADE_EXPECTED,
+    ),
+    (
+        "permutable_gap_block_with_upgrade",
+        (_PERMUTABLE_CHUNK_A, _PERMUTABLE_CHUNK_B),
+        2,
+        _PERMUTABLE_EXPECTED,
+    ),
+    (
+        "head_gap_row_absorbed_by_full_tail_row",
+        (_ABSORBED_CHUNK_A, _ABSORBED_CHUNK_B),
+        2,
+        _ABSORBED_EXPECTED,
+    ),
+    (
+        "verbatim_overlap_after_gap_row",
+        (_VERBATIM_CHUNK_A, _VERBATIM_CHUNK_B),
+        2,
+        _VERBATIM_EXPECTED,
+    ),
+    (
+        "unanchored_tail_gap_block_trimmed",
+        (_TAIL_TRIM_CHUNK_A, _TAIL_TRIM_CHUNK_B),
+        2,
+        _TAIL_TRIM_EXPECTED,
+    ),
+)
+
+# Cases dominated by long-sentence comparisons; skip with -m "not slow".
+_SLOW_CASES = frozenset(
+    {"overlap_upgrades_gap_row", "head_gap_row_absorbed_by_full_tail_row"}
+)
+_CASE_PARAMS = [
+    pytest.param(
+        *case, id=case[0], marks=pytest.mark.slow if case[0] in _SLOW_CASES else ()
+    )
+    for case in _CASES
+]
+
+
+def _encode_case(
+    chunks: tuple, expected: tuple
+) -> tuple[tuple[np.ndarray, ...], np.ndarray]:
+    """Encode a case's chunks and expected rows as (n, 2) int32 id arrays."""
+    vocab: dict = {None: -1}
+
+    def _encode(rows: tuple) -> np.ndarray:
+        ids = [[vocab.setdefault(token, len(vocab) - 1) for token in row] for row in rows]
+        return np.array(ids, dtype=np.int32).reshape(-1, 2)
+
+    encoded_chunks = tuple(_encode(chunk) for chunk in chunks)
+    return encoded_chunks, _encode(expected)
+
+
+_INT32_CASES = tuple(
+    (name, *_encode_case(chunks, expected), overlap_size)
+    for name, chunks, overlap_size, expected in _CASES
+)
+
+
+@pytest.mark.parametrize("name, chunks, overlap_size, expected", _CASE_PARAMS)
+def test_cases(name: str, chunks: tuple, overlap_size: int, expected: tuple) -> None:
+    result = tuple(stitch_all_chunks(chunks, overlap_size=overlap_size))
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "name, chunks, expected, overlap_size",
+    _INT32_CASES,
+    ids=[case[0] for case in _INT32_CASES],
+)
+def test_cases_int32(
+    name: str, chunks: tuple, expected: np.ndarray, overlap_size: int
+) -> None:
+    result = stitch_all_chunks_int32(chunks, overlap_size=overlap_size)
+
+    assert result.dtype == np.int32
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_no_canonical_anchor() -> None:
+    stitched = stitch_two_chunks(_NO_ANCHOR_TAIL, _NO_ANCHOR_CHUNK, overlap_size=1)
+
+    assert tuple(stitched) == _NO_ANCHOR_CHUNK
 
 
 if __name__ == "__main__":
-    unittest.main()
+    pytest.main([__file__])